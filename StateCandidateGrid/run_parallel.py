@@ -0,0 +1,141 @@
+"""
+Renders the four StateCandidateGrid views in parallel, one Blender process per view.
+
+Each GPU gets its own worker thread that runs its share of the views one after another
+through `blender --background --python main.py -- --angle-index N`, with
+CUDA_VISIBLE_DEVICES/HIP_VISIBLE_DEVICES pinning the process to that GPU. Once every view
+is written, the collage is assembled from the PNGs.
+
+The views are always rendered with Cycles (--high-quality is forwarded to main.py): the
+EEVEE preview ignores CUDA_VISIBLE_DEVICES, so there would be nothing to spread over the
+GPUs. Every process repeats the scene setup, so this only pays off on multi-GPU hosts.
+
+Usage:
+    python run_parallel.py --gpus 4 [--blender /path/to/blender] [-- <main.py arguments>]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+SCRIPT_PATH = Path(__file__).with_name("main.py")
+OUTPUT_DIRECTORY = SCRIPT_PATH.parent
+
+# Must match the views and file names written by main.py
+ANGLES_DEGREES = [0, 90, 180, 270]
+
+
+def view_path(index):
+    return OUTPUT_DIRECTORY / f"suzanne_{index:02d}_{ANGLES_DEGREES[index]}deg.png"
+
+
+def render_views(blender, gpu, view_indices, extra_args):
+    """
+    Renders `view_indices` sequentially in separate Blender processes pinned to `gpu`.
+    """
+    env = dict(os.environ, CUDA_VISIBLE_DEVICES=str(gpu), HIP_VISIBLE_DEVICES=str(gpu))
+    for index in view_indices:
+        command = [
+            blender,
+            "--background",
+            "--python",
+            str(SCRIPT_PATH),
+            "--",
+            "--angle-index",
+            str(index),
+            *extra_args,
+        ]
+        print(f"GPU {gpu}: rendering view {index} ({ANGLES_DEGREES[index]}°)")
+        subprocess.run(command, env=env, check=True)
+
+
+# The PNG helpers below mirror load_png/save_png/create_collage in main.py, which can't be
+# imported here because it imports bpy. Keep the two copies in sync.
+
+
+def load_png(path):
+    """
+    Reads a written render back as a uint8 RGBA array of shape (height, width, 4).
+    """
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGBA"))
+
+
+def save_png(image, output_path):
+    """
+    Writes a uint8 RGBA image array of shape (height, width, 4) to a PNG with zlib level 1.
+    """
+    pixels = np.ascontiguousarray(image)
+    height, width = pixels.shape[:2]
+    # Wrap the contiguous buffer directly rather than going through the array interface
+    png = Image.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
+    png.save(output_path, compress_level=1, optimize=False)
+
+
+def create_collage(tiles, output_path):
+    """
+    Creates a 2x2 collage from 4 uint8 RGBA arrays, as returned by `load_png`.
+    """
+    if len(tiles) != 4:
+        raise ValueError("This function requires exactly 4 images for a 2x2 collage.")
+
+    # Assuming all images are the same size: copy each tile straight into its quadrant of
+    # one preallocated uint8 collage instead of building intermediate rows
+    height, width = tiles[0].shape[:2]
+    collage = np.empty((2 * height, 2 * width, 4), dtype=np.uint8)
+    collage[:height, :width] = tiles[0]
+    collage[:height, width:] = tiles[1]
+    collage[height:, :width] = tiles[2]
+    collage[height:, width:] = tiles[3]
+
+    save_png(collage, output_path)
+    print(f"\nCollage saved to {output_path}")
+
+
+def main():
+    # Arguments after "--" are passed through to main.py
+    argv = sys.argv[1:]
+    extra_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, extra_args = argv[:split], argv[split + 1 :]
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--gpus", type=int, default=1, help="Number of GPUs to spread the views over.")
+    parser.add_argument(
+        "--blender",
+        default=os.environ.get("BLENDER", "blender"),
+        help="Blender executable (defaults to $BLENDER or 'blender' on PATH).",
+    )
+    args = parser.parse_args(argv)
+
+    # GPU pinning only affects Cycles
+    if "--high-quality" not in extra_args:
+        extra_args.append("--high-quality")
+
+    gpu_count = max(1, min(args.gpus, len(ANGLES_DEGREES)))
+    # Round-robin the views over the GPUs; each GPU renders its views one at a time
+    assignments = {gpu: list(range(gpu, len(ANGLES_DEGREES), gpu_count)) for gpu in range(gpu_count)}
+
+    with ThreadPoolExecutor(max_workers=gpu_count) as pool:
+        jobs = [
+            pool.submit(render_views, args.blender, gpu, view_indices, extra_args)
+            for gpu, view_indices in assignments.items()
+        ]
+        for job in jobs:
+            job.result()  # Re-raise a failed render
+
+    create_collage(
+        [load_png(view_path(index)) for index in range(len(ANGLES_DEGREES))],
+        OUTPUT_DIRECTORY / "suzanne_collage.png",
+    )
+
+
+if __name__ == "__main__":
+    main()
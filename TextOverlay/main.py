@@ -1,5 +1,8 @@
 # NOTE: This script must be invoked from inside Blender GUI.
+from operator import attrgetter
+
 import bpy
+from mathutils import Vector
 
 # CONFIGURATION
 # You can change these values to customize the labels
@@ -7,6 +10,7 @@ import bpy
 TEXT_SIZE = 0.4  # The font size of the text label
 TEXT_OFFSET_Z = 0.5  # How far above the object's top the label should float
 MATERIAL_NAME = "UI_Label_Material"  # The name for the special emissive material
+BILLBOARD_NAME = "UI_Label_Billboard"  # The empty that faces the camera for all labels
 EMISSION_COLOR = (1.0, 1.0, 1.0, 1.0)  # RGBA color (white by default)
 EMISSION_STRENGTH = 7.0  # Brightness of the text. Increase for more glow.
 
@@ -18,9 +22,10 @@ def create_or_get_emission_material(name, color, strength):
     Checks if a material with the given name exists.
     If it exists, it returns it. If not, it creates a new emissive material.
     """
-    # Check if the material already exists in the .blend file
-    if name in bpy.data.materials:
-        return bpy.data.materials[name]
+    # Check if the material already exists in the .blend file (one lookup, None on a miss)
+    mat = bpy.data.materials.get(name)
+    if mat is not None:
+        return mat
 
     # If not, create a new material
     mat = bpy.data.materials.new(name=name)
@@ -28,80 +33,145 @@ def create_or_get_emission_material(name, color, strength):
     nodes = mat.node_tree.nodes
     links = mat.node_tree.links
 
-    # Clear default nodes
-    nodes.clear()
+    # Keep the default Material Output and only swap the Principled BSDF for an Emission
+    # node, rather than clearing the tree and rebuilding the output
+    node_output = nodes.get("Material Output")
+    if node_output is None:
+        node_output = nodes.new(type="ShaderNodeOutputMaterial")
+    node_bsdf = nodes.get("Principled BSDF")
+    if node_bsdf is not None:
+        nodes.remove(node_bsdf)
 
-    # Create Emission and Material Output nodes
+    # Create the Emission node
     node_emission = nodes.new(type="ShaderNodeEmission")
-    node_emission.inputs["Color"].default_value = color
-    node_emission.inputs["Strength"].default_value = strength
-    node_emission.location = (0, 0)
-
-    node_output = nodes.new(type="ShaderNodeOutputMaterial")
-    node_output.location = (250, 0)
+    # Sockets are indexed by position (fixed order on these nodes) to skip name lookups
+    node_emission.inputs[0].default_value = color  # Color
+    node_emission.inputs[1].default_value = strength  # Strength
+    node_emission.location = (node_output.location.x - 250, node_output.location.y)
 
     # Link Emission to Output
-    links.new(node_emission.outputs["Emission"], node_output.inputs["Surface"])
+    links.new(node_emission.outputs[0], node_output.inputs[0])  # Emission -> Surface
 
     return mat
 
 
+def create_or_get_billboard(name, camera, collection, scene):
+    """
+    Returns an empty that tracks the camera, creating it if needed.
+    Labels copy its rotation, so only this one object evaluates a look-at constraint.
+    """
+    billboard = bpy.data.objects.get(name)
+    if billboard is None:
+        billboard = bpy.data.objects.new(name, None)
+    # An empty left over from another scene (or unlinked) would never be evaluated here
+    if billboard.name not in scene.objects:
+        collection.objects.link(billboard)
+
+    constraint = next((c for c in billboard.constraints if c.type == "TRACK_TO"), None)
+    if constraint is None:
+        constraint = billboard.constraints.new(type="TRACK_TO")
+        # FIX: Use TRACK_Z for text objects to make them face the camera correctly
+        constraint.track_axis = "TRACK_Z"
+        constraint.up_axis = "UP_Y"
+    constraint.target = camera
+    return billboard
+
+
 def create_ui_labels():
     """
     Main function to create and configure the text labels for selected objects.
     """
+    # Bind the context/data entry points once; each bare `bpy.context.x` is a global
+    # lookup plus an RNA getter chain
+    context = bpy.context
+    scene = context.scene
+
     # PRE-FLIGHT CHECKS
     # Check for an active camera
-    if not bpy.context.scene.camera:
+    if not scene.camera:
         print("ERROR: No active camera in the scene. Please add a camera.")
         return {"CANCELLED"}
 
-    # Get only the selected mesh objects
+    # Get only the selected mesh objects (attrgetter reads .type via a C-level getter)
+    get_type = attrgetter("type")
     selected_objects = [
-        obj for obj in bpy.context.selected_objects if obj.type == "MESH"
+        obj for obj in context.selected_objects if get_type(obj) == "MESH"
     ]
 
     if not selected_objects:
         print("INFO: No mesh objects selected. Please select objects to label.")
         return {"CANCELLED"}
 
-    camera = bpy.context.scene.camera
+    camera = scene.camera
 
     # Get or create the single material we'll use for all labels
     label_material = create_or_get_emission_material(
         MATERIAL_NAME, EMISSION_COLOR, EMISSION_STRENGTH
     )
 
-    # MAIN LOOP
-    # Process each selected object
-    for target_obj in selected_objects:
-        # Create a new text object at the world origin
-        bpy.ops.object.text_add(location=(0, 0, 0))
-        text_obj = bpy.context.active_object
-
-        # CONFIGURE TEXT
-        text_obj.name = f"{target_obj.name}_Label"
-        text_obj.data.body = target_obj.name
-        text_obj.data.size = TEXT_SIZE
-        text_obj.data.align_x = "CENTER"
-        text_obj.data.align_y = "CENTER"
-
-        # SET UP HIERARCHY & POSITION
-        text_obj.parent = target_obj
-        # Position the text above the object's bounding box
-        text_obj.location = (0, 0, target_obj.dimensions.z + TEXT_OFFSET_Z)
-
-        # ASSIGN MATERIAL & VISIBILITY
-        text_obj.data.materials.append(label_material)
-        # # Disable shadows for a clean UI look
-        # text_obj.shadow_mode = "NONE"
-
-        # ADD CAMERA TRACKING CONSTRAINT
-        constraint = text_obj.constraints.new(type="TRACK_TO")
-        constraint.target = camera
-        # FIX: Use TRACK_Z for text objects to make them face the camera correctly
-        constraint.track_axis = "TRACK_Z"
-        constraint.up_axis = "UP_Y"
+    # Resolve context once; the loop below only edits data, so no per-label updates fire
+    collection = context.collection
+    view_layer = context.view_layer
+    # Pre-bound methods used in the loop
+    objects_new = bpy.data.objects.new
+    objects_link = collection.objects.link
+
+    # PROTOTYPE TEXT DATA
+    # Every label shares the same text settings and material; only the body differs.
+    # Configure them once here and copy the datablock per label (a single C-level
+    # duplication) instead of repeating the property writes in the loop.
+    proto = bpy.data.curves.new(name="UI_Label_Proto", type="FONT")
+    proto.size = TEXT_SIZE
+    proto.align_x = "CENTER"
+    proto.align_y = "CENTER"
+    # Flat UI text doesn't need smooth glyph outlines: tessellate each curve segment
+    # coarsely (default is 12) and reuse that for renders (0 = same as viewport)
+    proto.resolution_u = 2
+    proto.render_resolution_u = 0
+    proto.materials.append(label_material)
+
+    try:
+        # Single camera-facing empty, placed among the labelled objects
+        billboard = create_or_get_billboard(BILLBOARD_NAME, camera, collection, scene)
+        billboard.location = sum(
+            (obj.matrix_world.translation for obj in selected_objects), Vector()
+        ) / len(selected_objects)
+
+        # MAIN LOOP
+        # Process each selected object
+        for target_obj in selected_objects:
+            # CREATE TEXT
+            # Build the text datablock and object directly; bpy.ops.object.text_add would
+            # dispatch an operator, push undo and update the depsgraph for every label
+            name = target_obj.name  # Read the RNA string once
+            label_name = name + "_Label"
+            txt_data = proto.copy()
+            txt_data.name = label_name  # Otherwise every copy is named "UI_Label_Proto.NNN"
+            txt_data.body = name
+
+            text_obj = objects_new(label_name, txt_data)
+            objects_link(text_obj)
+
+            # SET UP HIERARCHY & POSITION
+            text_obj.parent = target_obj
+            # Position the text above the object's bounding box (x/y of a new object are already 0)
+            text_obj.location.z = target_obj.dimensions.z + TEXT_OFFSET_Z
+
+            # VISIBILITY (the material comes with the prototype copy)
+            # # Disable shadows for a clean UI look
+            # text_obj.shadow_mode = "NONE"
+
+            # FACE THE CAMERA
+            # Copy the billboard's rotation instead of giving every label its own TRACK_TO
+            constraint = text_obj.constraints.new(type="COPY_ROTATION")
+            constraint.target = billboard
+    finally:
+        # The prototype is only a template; drop it so it doesn't linger as orphan data,
+        # even if creating a label failed
+        bpy.data.curves.remove(proto)
+
+    # Evaluate all the new labels in a single depsgraph update
+    view_layer.update()
 
     print(f"Successfully created UI labels for {len(selected_objects)} objects.")
     return {"FINISHED"}